@@ -1,5 +1,11 @@
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import reduce
 from pathlib import Path
 
+import numpy as np
+
 
 def read_and_clean_data():
     data_path = Path(__file__).parent / "day1_data.txt"
@@ -86,7 +92,186 @@ def calculate_zero_events(rotations):
     return zeros_at_end, zeros_all_clicks
 
 
+def iter_steps(data_path=None):
+    """
+    Yield signed rotation steps one line at a time, without keeping the file in
+    memory. `data_path="-"` reads from stdin.
+    """
+    if data_path is None:
+        data_path = Path(__file__).parent / "day1_data.txt"
+
+    if data_path == "-":
+        f = sys.stdin.buffer
+    else:
+        if not Path(data_path).exists():
+            raise FileNotFoundError(f"Data file not found: {data_path!s}.")
+        f = open(data_path, "rb")
+
+    try:
+        for line in f:
+            token = line.strip()
+            if not token:
+                continue
+            amount = int(token[1:])
+            yield amount if token[0] == ord("R") else -amount
+    finally:
+        if f is not sys.stdin.buffer:
+            f.close()
+
+
+def stream_zero_events(data_path=None):
+    """Single pass, O(1) memory version of `calculate_zero_events` (parts 1 and 2)."""
+    pos = 50
+    zeros_at_end = 0
+    zeros_all_clicks = 0
+
+    for step in iter_steps(data_path):
+        zeros_all_clicks += zeros_hit_from(pos, step)
+        pos = (pos + step) % 100
+        if pos == 0:
+            zeros_at_end += 1
+
+    return zeros_at_end, zeros_all_clicks
+
+
+def rotations_to_steps(rotations):
+    """
+    Parse `R`/`L` tokens into a signed int64 array (R > 0, L < 0)
+    without a Python-level loop over the digits.
+    """
+    if not rotations:
+        return np.zeros(0, dtype=np.int64)
+    return bytes_to_steps(("\n".join(rotations) + "\n").encode("ascii"))
+
+
+def bytes_to_steps(data):
+    """Same as `rotations_to_steps`, but for raw newline-separated bytes."""
+    # split() strips every line, like `read_and_clean_data` does
+    tokens = np.array(data.split())
+    if tokens.size == 0:
+        return np.zeros(0, dtype=np.int64)
+
+    raw = tokens.view(np.uint8).reshape(tokens.size, -1)
+    amounts = np.ascontiguousarray(raw[:, 1:]).view(f"S{raw.shape[1] - 1}").ravel().astype(np.int64)
+
+    return np.where(raw[:, 0] == ord("R"), amounts, -amounts)
+
+
+def calculate_zero_events_numpy(rotations):
+    """
+    Batched version of `calculate_zero_events`: same (zeros_at_end, zeros_all_clicks)
+    result, computed with cumulative sums and floor division.
+    """
+    steps = rotations_to_steps(rotations)
+    if steps.size == 0:
+        return 0, 0
+
+    ends = (50 + np.cumsum(steps)) % 100
+    starts = np.concatenate(([50], ends[:-1]))
+    targets = starts + steps
+
+    zeros_at_end = int(np.count_nonzero(ends == 0))
+
+    # multiples of 100 in (start, target] when moving right,
+    # and in [target, start) when moving left
+    right = targets // 100 - starts // 100
+    left = (starts - 1) // 100 - (targets - 1) // 100
+    zeros_all_clicks = int(np.where(steps > 0, right, left).sum())
+
+    return zeros_at_end, zeros_all_clicks
+
+
+def summarise_steps(steps):
+    """
+    Summarise a run of rotations as a (100, 3) table. Row `s` holds, for a dial
+    starting at position s: (end position, zeros at end, zeros on all clicks).
+    """
+    positions = np.arange(100, dtype=np.int64)
+    if steps.size == 0:
+        return np.stack([positions, 0 * positions, 0 * positions], axis=1)
+
+    # unwrapped offsets from the chunk start before (a) and after (b) each rotation
+    b = np.cumsum(steps)
+    a = np.concatenate(([0], b[:-1]))
+
+    end = (positions + b[-1]) % 100
+    at_end = np.bincount(b % 100, minlength=100)[(-positions) % 100]
+
+    # (s + x) // 100 == x // 100 + [x % 100 + s >= 100], so every hit count from
+    # `calculate_zero_events_numpy` splits into a start-independent base plus
+    # indicator terms that only depend on a residue.
+    right = steps > 0
+    left = ~right
+    base = (b[right] // 100 - a[right] // 100).sum()
+    base += ((a[left] - 1) // 100 - (b[left] - 1) // 100).sum()
+
+    plus = np.concatenate((b[right] % 100, (a[left] - 1) % 100))
+    minus = np.concatenate((a[right] % 100, (b[left] - 1) % 100))
+    hist = np.bincount(plus, minlength=100) - np.bincount(minus, minlength=100)
+    suffix = np.concatenate((np.cumsum(hist[::-1])[::-1], [0]))
+    all_clicks = base + suffix[100 - positions]
+
+    return np.stack([end, at_end, all_clicks], axis=1).astype(np.int64)
+
+
+def compose_summaries(first, second):
+    """Table for running `first` and then `second` (associative)."""
+    mid = first[:, 0]
+    return np.stack(
+        [second[mid, 0], first[:, 1] + second[mid, 1], first[:, 2] + second[mid, 2]],
+        axis=1,
+    )
+
+
+def _summarise_file_chunk(data_path, start, end):
+    with open(data_path, "rb") as f:
+        f.seek(start)
+        return summarise_steps(bytes_to_steps(f.read(end - start)))
+
+
+def _chunk_boundaries(data_path, chunks):
+    """Split the file into `chunks` byte ranges that start and end on line breaks."""
+    size = os.path.getsize(data_path)
+    bounds = [0]
+    with open(data_path, "rb") as f:
+        for i in range(1, chunks):
+            offset = max(size * i // chunks, bounds[-1])
+            f.seek(offset)
+            f.readline()
+            bounds.append(min(f.tell(), size))
+    bounds.append(size)
+    return [(lo, hi) for lo, hi in zip(bounds, bounds[1:]) if hi > lo]
+
+
+def calculate_zero_events_parallel(data_path=None, workers=None, chunks=None):
+    """
+    Multi-process version of `calculate_zero_events` reading straight from the file.
+    Each chunk is summarised independently and the tables are composed in order.
+    """
+    if data_path is None:
+        data_path = Path(__file__).parent / "day1_data.txt"
+    workers = workers or os.cpu_count() or 1
+    chunks = chunks or workers * 4
+
+    ranges = _chunk_boundaries(data_path, chunks)
+    if not ranges:
+        return 0, 0
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        tables = pool.map(_summarise_file_chunk, *zip(*((data_path, lo, hi) for lo, hi in ranges)))
+        table = reduce(compose_summaries, tables)
+
+    return int(table[50, 1]), int(table[50, 2])
+
+
 if __name__ == "__main__":
+    # `python day1.py <file>` (or `-` for stdin) streams the log instead
+    if len(sys.argv) > 1:
+        zeros_at_end, zeros_all_clicks = stream_zero_events(sys.argv[1])
+        print("Part 1 – zeros at end:", zeros_at_end)
+        print("Part 2 – total times dial points at 0 (during + at end):", zeros_all_clicks)
+        sys.exit()
+
     rotations = read_and_clean_data()
 
     # Part 1 (your original logic)
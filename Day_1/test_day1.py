@@ -0,0 +1,12 @@
+import day1
+
+
+def test_parallel_matches_loop_with_trailing_spaces(tmp_path):
+    lines = ["R50 ", "L10", "  R60", "L250\t", "R5"]
+    data_path = tmp_path / "rotations.txt"
+    data_path.write_text("\n".join(lines) + "\n\n")
+
+    expected = day1.calculate_zero_events([line.strip() for line in lines])
+    assert day1.calculate_zero_events_parallel(data_path, workers=2, chunks=3) == expected
+    assert day1.calculate_zero_events_numpy(lines) == expected
+    assert day1.stream_zero_events(data_path) == expected
@@ -1,4 +1,7 @@
 from pathlib import Path
+from typing import NamedTuple
+
+import numpy as np
 
 
 def read_and_clean_data():
@@ -28,6 +31,46 @@ def calculate_ids(ranges):
     return sum(ids)
 
 
+def parse_ranges(ranges):
+    """Turn the raw `start-end,start-end` lines into a list of (start, end) pairs."""
+    pairs = []
+    for r in ranges:
+        for pair in r.split(","):
+            if pair.strip():
+                start, end = map(int, pair.split("-"))
+                pairs.append((start, end))
+    return pairs
+
+
+def _sum_with_period(start, end, length, period):
+    """
+    Sum of all `length`-digit numbers in [start, end] made of a `period`-digit
+    block repeated. Those are x * (10**length - 1) // (10**period - 1) for a
+    `period`-digit x, i.e. one arithmetic series.
+    """
+    multiplier = (10**length - 1) // (10**period - 1)
+    lo = max(10 ** (period - 1), -(-start // multiplier))
+    hi = min(10**period - 1, end // multiplier)
+    if lo > hi:
+        return 0
+    return multiplier * (lo + hi) * (hi - lo + 1) // 2
+
+
+def sum_doubled_in_range(start, end):
+    """Sum of all numbers `hh` (a half repeated twice) in [start, end]."""
+    total = 0
+    h = 1
+    while 10 ** (2 * h - 1) <= end:
+        total += _sum_with_period(start, end, 2 * h, h)
+        h += 1
+    return total
+
+
+def calculate_ids_fast(ranges):
+    """Same result as `calculate_ids`, without visiting every number in the ranges."""
+    return sum(sum_doubled_in_range(start, end) for start, end in parse_ranges(ranges))
+
+
 def calculate_more_ids(ranges):
     ids = []
     for r in ranges:
@@ -53,6 +96,119 @@ def calculate_more_ids(ranges):
     return sum(ids)
 
 
+def _mobius(n):
+    result = 1
+    p = 2
+    while p * p <= n:
+        if n % p == 0:
+            n //= p
+            if n % p == 0:
+                return 0
+            result = -result
+        p += 1
+    return -result if n > 1 else result
+
+
+def sum_repeated_in_range(start, end):
+    """
+    Sum of all numbers in [start, end] made of a block repeated k >= 2 times.
+
+    For each digit length L, a number with period d also has period e for every
+    d | e | L, so plain summing over periods double counts (e.g. 111111).
+    Möbius inversion over the divisors gives the union directly:
+        sum = -sum(mobius(L // d) * S(d) for proper divisors d of L)
+    where S(d) is the (closed-form) sum of numbers with period d.
+    """
+    total = 0
+    length = 2
+    while 10 ** (length - 1) <= end:
+        for period in range(1, length // 2 + 1):
+            if length % period == 0:
+                mu = _mobius(length // period)
+                if mu:
+                    total -= mu * _sum_with_period(start, end, length, period)
+        length += 1
+    return total
+
+
+def calculate_more_ids_fast(ranges):
+    """Same result as `calculate_more_ids`, computed per digit length."""
+    return sum(sum_repeated_in_range(start, end) for start, end in parse_ranges(ranges))
+
+
+class IdIndex(NamedTuple):
+    """Sorted invalid IDs up to `bound` with prefix sums (prefix[i] == sum(ids[:i]))."""
+
+    bound: int
+    ids: np.ndarray
+    prefix: np.ndarray
+
+
+def build_id_index(bound, part=2):
+    """
+    Index every invalid ID <= bound (part 1: half repeated twice,
+    part 2: any block repeated k >= 2 times).
+    """
+    if sum_repeated_in_range(1, bound) >= 2**63:
+        raise ValueError(f"Bound {bound} is too large: prefix sums would overflow int64.")
+
+    chunks = []
+    length = 2
+    while 10 ** (length - 1) <= bound:
+        for period in range(1, length // 2 + 1):
+            if length % period == 0 and (part == 2 or 2 * period == length):
+                multiplier = (10**length - 1) // (10**period - 1)
+                hi = min(10**period - 1, bound // multiplier)
+                blocks = np.arange(10 ** (period - 1), hi + 1, dtype=np.int64)
+                chunks.append(blocks * multiplier)
+        length += 1
+
+    ids = np.unique(np.concatenate(chunks)) if chunks else np.zeros(0, dtype=np.int64)
+    prefix = np.concatenate(([0], np.cumsum(ids)))
+    return IdIndex(bound, ids, prefix)
+
+
+def load_id_index(bound, part=2, cache_dir=None):
+    """
+    Load the index for `bound` memory-mapped from `cache_dir` (defaults to the
+    `Day_2` folder), building and saving it there first if needed.
+    """
+    cache_dir = Path(cache_dir) if cache_dir is not None else Path(__file__).parent
+    ids_path = cache_dir / f"day2_part{part}_ids_{bound}.npy"
+    prefix_path = cache_dir / f"day2_part{part}_prefix_{bound}.npy"
+
+    if not (ids_path.exists() and prefix_path.exists()):
+        index = build_id_index(bound, part)
+        np.save(ids_path, index.ids)
+        np.save(prefix_path, index.prefix)
+
+    return IdIndex(bound, np.load(ids_path, mmap_mode="r"), np.load(prefix_path, mmap_mode="r"))
+
+
+def sum_ids_in_ranges(index, starts, ends):
+    """Per-range sums of invalid IDs in [start, end], two binary searches each."""
+    starts = np.asarray(starts, dtype=np.int64)
+    ends = np.asarray(ends, dtype=np.int64)
+    if ends.size and ends.max() > index.bound:
+        raise ValueError(f"Range end {ends.max()} is above the index bound {index.bound}.")
+
+    lo = np.searchsorted(index.ids, starts, side="left")
+    hi = np.searchsorted(index.ids, ends, side="right")
+    # a reversed range (start > end) is empty
+    hi = np.maximum(hi, lo)
+    return index.prefix[hi] - index.prefix[lo]
+
+
+def calculate_ids_indexed(ranges, index):
+    """Same result as `calculate_ids` / `calculate_more_ids` for the index's part."""
+    pairs = parse_ranges(ranges)
+    if not pairs:
+        return 0
+    starts, ends = zip(*pairs)
+    # per-range sums fit in int64, their total may not
+    return sum(sum_ids_in_ranges(index, starts, ends).tolist())
+
+
 if __name__ == "__main__":
     id_ranges = read_and_clean_data()
     print(
@@ -1,5 +1,8 @@
+import mmap
 from pathlib import Path
 
+import numpy as np
+
 
 def read_and_clean_data():
     data_path = Path(__file__).parent / "day3_data.txt"
@@ -38,32 +41,69 @@ def calculate_joltage_differences(batteries):
     print(total)
     return total
 
-def max_joltage_12_for_bank(bank: str, k: int = 12) -> int:
-    L = len(bank)
-    assert L >= k, f"Bank too short: length {L}, need {k}"
 
-    result_digits = []
-    start = 0
-    remaining = k
+def _max_joltage_matrix(digits: np.ndarray) -> np.ndarray:
+    """Best two-digit value per row of an equal-length (banks, L) digit matrix."""
+    if digits.shape[1] < 2:
+        return np.full(digits.shape[0], -1, dtype=np.int64)
+    suffix_max = np.maximum.accumulate(digits[:, ::-1], axis=1)[:, ::-1]
+    values = 10 * digits[:, :-1].astype(np.int64) + suffix_max[:, 1:]
+    return values.max(axis=1)
+
+
+def max_joltage_batch(batteries) -> np.ndarray:
+    """
+    Vectorized `max_joltage_for_bank` for many banks: all banks go into one uint8
+    digit matrix, with a per-row fallback when bank lengths differ.
+    """
+    if not batteries:
+        return np.zeros(0, dtype=np.int64)
+
+    width = len(batteries[0])
+    if all(len(bank) == width for bank in batteries):
+        raw = np.frombuffer("".join(batteries).encode("ascii"), dtype=np.uint8)
+        return _max_joltage_matrix((raw - ord("0")).reshape(len(batteries), width))
+
+    result = np.empty(len(batteries), dtype=np.int64)
+    for i, bank in enumerate(batteries):
+        row = np.frombuffer(bank.encode("ascii"), dtype=np.uint8) - ord("0")
+        result[i] = _max_joltage_matrix(row[None, :])[0]
+    return result
+
+
+def calculate_joltage_differences_numpy(batteries):
+    return int(max_joltage_batch(batteries).sum())
+
 
-    while remaining > 0:
-        end = L - remaining
-        best_digit = "-1"
-        best_pos = None
+def max_joltage_for_ks(bank: str, ks) -> dict[int, int]:
+    """
+    Best k-digit subsequence value of `bank` (str or bytes-like) for every k in
+    `ks`, in one pass.
 
-        for i in range(start, end + 1):
-            d = bank[i]
-            if d > best_digit:
-                best_digit = d
-                best_pos = i
-                if best_digit == "9":
-                    break
+    Each k keeps a monotonic stack: a smaller digit is popped whenever a larger
+    one arrives and we can still afford to drop L - k digits, so every k costs O(L).
+    """
+    # digits are compared as byte values, so bytes/memoryview banks need no decoding
+    digits = bank.encode("ascii") if isinstance(bank, str) else bank
+    L = len(digits)
+    for k in ks:
+        assert L >= k, f"Bank too short: length {L}, need {k}"
 
-        result_digits.append(best_digit)
-        start = best_pos + 1
-        remaining -= 1
+    stacks = {k: [] for k in ks}
+    drops = {k: L - k for k in ks}
 
-    return int("".join(result_digits))
+    for d in digits:
+        for k, stack in stacks.items():
+            while drops[k] and stack and stack[-1] < d:
+                stack.pop()
+                drops[k] -= 1
+            stack.append(d)
+
+    return {k: int(bytes(stack[:k]) or b"0") for k, stack in stacks.items()}
+
+
+def max_joltage_12_for_bank(bank: str, k: int = 12) -> int:
+    return max_joltage_for_ks(bank, (k,))[k]
 
 
 def total_output_joltage_part2(batteries):
@@ -74,6 +114,55 @@ def total_output_joltage_part2(batteries):
     return total
 
 
+def total_output_joltage_for_ks(batteries, ks=(2, 6, 12, 20)) -> dict[int, int]:
+    """`total_output_joltage_part2` totals for several k values at once."""
+    totals = dict.fromkeys(ks, 0)
+    for bank in batteries:
+        for k, value in max_joltage_for_ks(bank, ks).items():
+            totals[k] += value
+    return totals
+
+
+def iter_banks_mmap(view: memoryview):
+    """Yield each non-empty bank row of a mapped file as a zero-copy memoryview slice."""
+    size = len(view)
+    start = 0
+    while start < size:
+        end = view.obj.find(b"\n", start)
+        if end == -1:
+            end = size
+        stop = end
+        while stop > start and view[stop - 1] in b" \t\r":
+            stop -= 1
+        if stop > start:
+            yield view[start:stop]
+        start = end + 1
+
+
+def solve_from_mmap(data_path=None, k: int = 12) -> tuple[int, int]:
+    """
+    Part 1 and part 2 totals straight from a memory-mapped data file, without
+    building a Python string per bank.
+    """
+    if data_path is None:
+        data_path = Path(__file__).parent / "day3_data.txt"
+
+    part1 = 0
+    part2 = 0
+    with open(data_path, "rb") as f:
+        if f.seek(0, 2) == 0:
+            return part1, part2
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+            for row in iter_banks_mmap(view):
+                # release each slice even on error, or closing the mmap fails
+                with row:
+                    values = max_joltage_for_ks(row, (2, k))
+                part1 += values[2]
+                part2 += values[k]
+
+    return part1, part2
+
+
 if __name__ == "__main__":
     battery_data = read_and_clean_data()
     final_result = calculate_joltage_differences(battery_data)
@@ -0,0 +1,128 @@
+import time
+from typing import NamedTuple
+
+import numpy as np
+
+# Day 4 neighbourhood: the 8 surrounding cells
+MOORE_KERNEL = np.array(
+    [
+        [1, 1, 1],
+        [1, 0, 1],
+        [1, 1, 1],
+    ]
+)
+
+# 4 orthogonal neighbours
+VON_NEUMANN_KERNEL = np.array(
+    [
+        [0, 1, 0],
+        [1, 0, 1],
+        [0, 1, 0],
+    ]
+)
+
+
+class AutomatonRun(NamedTuple):
+    final: np.ndarray  # boolean mask of target cells left at the end
+    removed_per_step: list[int]
+    step_seconds: list[float]  # includes the final step that found nothing to remove
+
+    @property
+    def total_removed(self) -> int:
+        return sum(self.removed_per_step)
+
+
+class Automaton:
+    """
+    Removal automaton generalising Day 4: every `target` cell whose weighted
+    neighbour count (per `kernel`, centred on the cell) is below `threshold`
+    is removed, synchronously, once per step.
+
+    Day 4 is `Automaton(MOORE_KERNEL, threshold=4, target="@")`.
+    """
+
+    def __init__(self, kernel=MOORE_KERNEL, threshold: int = 4, target: str = "@"):
+        kernel = np.asarray(kernel)
+        if kernel.ndim != 2 or kernel.shape[0] % 2 == 0 or kernel.shape[1] % 2 == 0:
+            raise ValueError(f"Kernel must be 2D with odd dimensions, got shape {kernel.shape}.")
+
+        self.threshold = threshold
+        self.target = target
+        self.pad_r = kernel.shape[0] // 2
+        self.pad_c = kernel.shape[1] // 2
+        # non-zero kernel entries as (row offset, col offset, weight), computed once
+        self.taps = [
+            (r - self.pad_r, c - self.pad_c, int(kernel[r, c]))
+            for r, c in zip(*np.nonzero(kernel))
+        ]
+
+    def to_mask(self, grid) -> np.ndarray:
+        if isinstance(grid, np.ndarray):
+            return grid.astype(bool)
+        raw = np.frombuffer("".join(grid).encode("ascii"), dtype=np.uint8)
+        return raw.reshape(len(grid), len(grid[0])) == ord(self.target)
+
+    def spread(self, mask: np.ndarray) -> np.ndarray:
+        """Weighted count of `mask` cells in the kernel neighbourhood of every cell."""
+        rows, cols = mask.shape
+        padded = np.zeros((rows + 2 * self.pad_r, cols + 2 * self.pad_c), dtype=np.int32)
+        padded[self.pad_r : self.pad_r + rows, self.pad_c : self.pad_c + cols] = mask
+
+        counts = np.zeros((rows, cols), dtype=np.int32)
+        for dr, dc, weight in self.taps:
+            window = padded[
+                self.pad_r + dr : self.pad_r + dr + rows,
+                self.pad_c + dc : self.pad_c + dc + cols,
+            ]
+            counts += weight * window
+        return counts
+
+    def _unspread(self, counts: np.ndarray, rows: np.ndarray, cols: np.ndarray) -> np.ndarray:
+        """
+        Subtract the contribution of the removed cells at (rows, cols) from
+        `counts`, touching only their neighbourhoods. Returns the flat indices
+        of the cells whose count changed.
+        """
+        height, width = counts.shape
+        touched = []
+        for dr, dc, weight in self.taps:
+            # a cell at offset (dr, dc) from x counts towards x
+            r = rows - dr
+            c = cols - dc
+            inside = (r >= 0) & (r < height) & (c >= 0) & (c < width)
+            r = r[inside]
+            c = c[inside]
+            # distinct removed cells map to distinct targets for a fixed tap
+            counts[r, c] -= weight
+            touched.append(r * width + c)
+        return np.unique(np.concatenate(touched)) if touched else np.zeros(0, dtype=np.intp)
+
+    def run(self, grid, max_steps: int | None = None) -> AutomatonRun:
+        """
+        Apply steps until nothing changes (fixed point), or at most `max_steps`.
+        Neighbour counts are computed once for the whole grid. After that, each
+        step only updates, and re-checks, the neighbourhoods of the cells it removed.
+        """
+        mask = self.to_mask(grid).copy()
+        counts = self.spread(mask)
+        removed_per_step = []
+        step_seconds = []
+
+        flat_mask = mask.ravel()
+        flat_counts = counts.ravel()
+        candidates = np.flatnonzero(flat_mask)
+
+        while max_steps is None or len(removed_per_step) < max_steps:
+            started = time.perf_counter()
+
+            removed = candidates[flat_mask[candidates] & (flat_counts[candidates] < self.threshold)]
+            if removed.size:
+                flat_mask[removed] = False
+                candidates = self._unspread(counts, *np.divmod(removed, mask.shape[1]))
+
+            step_seconds.append(time.perf_counter() - started)
+            if not removed.size:
+                break
+            removed_per_step.append(int(removed.size))
+
+        return AutomatonRun(mask, removed_per_step, step_seconds)
@@ -1,5 +1,10 @@
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+import numpy as np
+
 DIRECTIONS = [
     (-1, -1), (-1, 0), (-1, 1),
     (0, -1),           (0, 1),
@@ -35,6 +40,39 @@ def find_accessible_positions(grid: list[str]) -> list[tuple[int, int]]:
     return result
 
 
+def grid_to_array(grid: list[str]) -> np.ndarray:
+    """Boolean (rows, cols) array, True where the grid has a roll (`@`)."""
+    raw = np.frombuffer("".join(grid).encode("ascii"), dtype=np.uint8)
+    return raw.reshape(len(grid), len(grid[0])) == ord("@")
+
+
+def neighbour_counts(mask: np.ndarray) -> np.ndarray:
+    """Number of `@` among the 8 neighbours of every cell, via shifted-slice sums."""
+    rows, cols = mask.shape
+    padded = np.zeros((rows + 2, cols + 2), dtype=np.uint8)
+    padded[1:-1, 1:-1] = mask
+
+    counts = np.zeros((rows, cols), dtype=np.uint8)
+    for dr, dc in DIRECTIONS:
+        counts += padded[1 + dr : 1 + dr + rows, 1 + dc : 1 + dc + cols]
+    return counts
+
+
+def find_accessible_mask(mask: np.ndarray) -> np.ndarray:
+    return mask & (neighbour_counts(mask) < 4)
+
+
+def find_accessible_positions_numpy(grid: list[str], coordinates: bool = False):
+    """
+    NumPy version of `find_accessible_positions`. Returns the accessible mask, or
+    the same (row, col) list as the loop version when `coordinates` is set.
+    """
+    accessible = find_accessible_mask(grid_to_array(grid))
+    if coordinates:
+        return [(int(r), int(c)) for r, c in np.argwhere(accessible)]
+    return accessible
+
+
 def remove_positions(grid: list[str], positions: list[tuple[int, int]]) -> list[str]:
     new = [list(row) for row in grid]
     for r, c in positions:
@@ -57,14 +95,237 @@ def total_removed_rolls(grid: list[str]) -> int:
     return total
 
 
+def removal_rounds(grid: list[str]) -> np.ndarray:
+    """
+    Round in which every roll is removed by `total_removed_rolls` (1-based),
+    0 for cells that are empty or never removed.
+
+    Worklist peeling: neighbour counts are kept in a flat padded array and only
+    the neighbours of removed rolls are updated, so each cell is touched O(1) times.
+    """
+    mask = grid_to_array(grid)
+    rows, cols = mask.shape
+    width = cols + 2
+
+    present = np.zeros((rows + 2, width), dtype=bool)
+    present[1:-1, 1:-1] = mask
+    counts = np.zeros((rows + 2, width), dtype=np.uint8)
+    counts[1:-1, 1:-1] = neighbour_counts(mask)
+
+    offsets = [dr * width + dc for dr, dc in DIRECTIONS]
+    present = present.ravel().tolist()
+    counts = counts.ravel().tolist()
+    rounds = [0] * len(present)
+
+    frontier = [
+        (r + 1) * width + c + 1 for r, c in np.argwhere(find_accessible_mask(mask)).tolist()
+    ]
+    for i in frontier:
+        rounds[i] = 1
+
+    current = 1
+    while frontier:
+        for i in frontier:
+            present[i] = False
+
+        next_frontier = []
+        for i in frontier:
+            for off in offsets:
+                j = i + off
+                if present[j]:
+                    counts[j] -= 1
+                    if counts[j] < 4 and not rounds[j]:
+                        rounds[j] = current + 1
+                        next_frontier.append(j)
+
+        frontier = next_frontier
+        current += 1
+
+    return np.array(rounds, dtype=np.int32).reshape(rows + 2, width)[1:-1, 1:-1]
+
+
+def removed_per_round(rounds: np.ndarray) -> list[int]:
+    """Number of rolls removed in each round, from a `removal_rounds` map."""
+    return np.bincount(rounds.ravel())[1:].tolist()
+
+
+def total_removed_rolls_worklist(grid: list[str]) -> int:
+    return int(np.count_nonzero(removal_rounds(grid)))
+
+
+# maps '@' to '1' and every other byte to '0', so any non-roll cell counts as empty
+_ROLL_BITS = bytes(ord("1") if b == ord("@") else ord("0") for b in range(256))
+
+
+class Bitboard:
+    """
+    Grid of rolls packed one row per Python int (bit c set = `@` in column c),
+    so neighbour logic runs on whole machine words at a time.
+    """
+
+    def __init__(self, rows: list[int], width: int):
+        self.rows = rows
+        self.width = width
+        self.full = (1 << width) - 1
+
+    @classmethod
+    def from_grid(cls, grid: list[str]) -> "Bitboard":
+        width = len(grid[0])
+        rows = [
+            int(line.encode("ascii", "replace").translate(_ROLL_BITS)[::-1], 2) if line else 0
+            for line in grid
+        ]
+        return cls(rows, width)
+
+    def count(self) -> int:
+        return sum(row.bit_count() for row in self.rows)
+
+    def accessible(self) -> list[int]:
+        """Per-row bitmasks of rolls with fewer than 4 of their 8 neighbours set."""
+        full = self.full
+        result = []
+        above = 0
+        rows = self.rows + [0]
+
+        for r, row in enumerate(self.rows):
+            below = rows[r + 1]
+            neighbours = (
+                (above << 1) & full, above, above >> 1,
+                (row << 1) & full,          row >> 1,
+                (below << 1) & full, below, below >> 1,
+            )
+
+            # bit-sliced counter: two bits for count mod 4, plus a sticky ">= 4" bit
+            ones = twos = at_least_four = 0
+            for bits in neighbours:
+                carry = ones & bits
+                ones ^= bits
+                at_least_four |= twos & carry
+                twos ^= carry
+
+            result.append(row & ~at_least_four)
+            above = row
+
+        return result
+
+    def remove(self, masks: list[int]) -> None:
+        self.rows = [row & ~mask for row, mask in zip(self.rows, masks)]
+
+
+def total_removed_rolls_bitboard(board: Bitboard) -> int:
+    total = 0
+    while True:
+        accessible = board.accessible()
+        removed = sum(mask.bit_count() for mask in accessible)
+        if not removed:
+            return total
+        total += removed
+        board.remove(accessible)
+
+
+def map_grid(path) -> np.ndarray:
+    """
+    Memory-map a rectangular grid file as a read-only (rows, cols) uint8 view,
+    without loading it into memory.
+    """
+    with open(path, "rb") as f:
+        first = f.readline()
+    cols = len(first.rstrip(b"\r\n"))
+    stride = max(len(first), cols + 1)
+    raw = np.memmap(path, dtype=np.uint8, mode="r")
+
+    # ignore trailing blank lines/whitespace, like `read_grid` does
+    size = raw.size
+    while size and raw[size - 1] in b" \t\r\n":
+        size -= 1
+
+    # every row is `cols` bytes plus its line break (the last one without it)
+    rows = (size + stride - cols) // stride
+    if size != rows * stride - (stride - cols):
+        raise ValueError("Grid rows have inconsistent length.")
+
+    return np.lib.stride_tricks.as_strided(raw, shape=(rows, cols), strides=(stride, 1))
+
+
+def _init_band(data_path, state_path, lo, hi):
+    state = np.load(state_path, mmap_mode="r+")
+    state[lo:hi] = map_grid(data_path)[lo:hi] == ord("@")
+    state.flush()
+    return state[lo].copy(), state[hi - 1].copy()
+
+
+def _peel_band(state_path, lo, hi, above, below):
+    """
+    One synchronous removal round on rows [lo, hi). `above`/`below` are the halo
+    rows as they were at the start of the round. Returns the number of rolls
+    removed and the band's new first and last rows.
+    """
+    state = np.load(state_path, mmap_mode="r+")
+    band = np.vstack([above[None, :], state[lo:hi], below[None, :]])
+    accessible = find_accessible_mask(band)[1:-1]
+
+    removed = int(np.count_nonzero(accessible))
+    if removed:
+        state[lo:hi] &= ~accessible
+        state.flush()
+    return removed, state[lo].copy(), state[hi - 1].copy()
+
+
+def solve_tiled(data_path, band_rows: int = 1024, workers: int | None = None) -> tuple[int, int]:
+    """
+    Part 1 and part 2 for grids too large for memory. The grid is split into
+    horizontal bands processed in a process pool; the working state lives in an
+    on-disk memmap and only the halo rows travel between rounds.
+    """
+    rows, cols = map_grid(data_path).shape
+    bands = [(lo, min(lo + band_rows, rows)) for lo in range(0, rows, band_rows)]
+    empty = np.zeros(cols, dtype=bool)
+
+    with tempfile.TemporaryDirectory() as tmp, ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+        state_path = os.path.join(tmp, "state.npy")
+        np.lib.format.open_memmap(state_path, mode="w+", dtype=bool, shape=(rows, cols)).flush()
+
+        edges = list(pool.map(_init_band, *zip(*[(data_path, state_path, lo, hi) for lo, hi in bands])))
+        removed = [1] * len(bands)
+        part1 = None
+        total = 0
+
+        while any(removed):
+            # a band whose neighbourhood did not change last round cannot change now
+            active = [
+                i for i in range(len(bands))
+                if removed[i] or (i > 0 and removed[i - 1]) or (i + 1 < len(bands) and removed[i + 1])
+            ]
+            jobs = {
+                i: pool.submit(
+                    _peel_band, state_path, *bands[i],
+                    edges[i - 1][1] if i > 0 else empty,
+                    edges[i + 1][0] if i + 1 < len(bands) else empty,
+                )
+                for i in active
+            }
+
+            removed = [0] * len(bands)
+            for i, job in jobs.items():
+                removed[i], first, last = job.result()
+                edges[i] = (first, last)
+
+            total += sum(removed)
+            if part1 is None:
+                part1 = total
+
+    return part1 or 0, total
+
+
 # ----------- ENTRY POINTS -----------
 
 def solve_part1(grid):
-    return len(find_accessible_positions(grid))
+    board = Bitboard.from_grid(grid)
+    return sum(mask.bit_count() for mask in board.accessible())
 
 
 def solve_part2(grid):
-    return total_removed_rolls(grid)
+    return total_removed_rolls_bitboard(Bitboard.from_grid(grid))
 
 
 if __name__ == "__main__":
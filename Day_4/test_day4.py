@@ -0,0 +1,8 @@
+import day4
+
+
+def test_bitboard_treats_other_symbols_as_empty():
+    grid = ["@x@", "@@@", ".@.", "x@@"]
+
+    assert day4.solve_part1(grid) == len(day4.find_accessible_positions(grid))
+    assert day4.solve_part2(grid) == day4.total_removed_rolls(grid)
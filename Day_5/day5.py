@@ -1,5 +1,11 @@
+import os
+from bisect import bisect_right
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+import numpy as np
+
 
 def read_and_clean_data():
     data_path_1 = Path(__file__).parent / "day5_fresh.txt"
@@ -25,21 +31,8 @@ def read_and_clean_data():
     
     return fresh_list, ingredients_list
 
-def find_fresh_ingredients(fresh_list, ingredients_list):
-    fresh_ranges = [tuple(map(int, f.split('-'))) for f in fresh_list]
-    ingredients = [int(i) for i in ingredients_list]
-
-    fresh_ingredients = 0
-
-    for ingredient in ingredients:
-        if any(start <= ingredient <= end for start, end in fresh_ranges):
-            fresh_ingredients += 1
-
-    print(f"Found {fresh_ingredients} fresh ingredients.")
-    return fresh_ingredients
-
-def ids_considered_fresh(fresh_list):
-    """Part 2: count how many distinct IDs are covered by the fresh ranges."""
+def merge_ranges(fresh_list):
+    """Sorted list of disjoint [start, end] ranges covering the same IDs as `fresh_list`."""
     ranges = [tuple(map(int, f.split("-"))) for f in fresh_list]
 
     # 1) sort by start
@@ -60,12 +53,233 @@ def ids_considered_fresh(fresh_list):
                 # Disjoint: start a new merged range
                 merged.append([start, end])
 
-    # 3) sum lengths of merged ranges (inclusive)
+    return merged
+
+
+def is_fresh(merged, starts, ingredient):
+    """Binary search `ingredient` in merged ranges (`starts` = their start values)."""
+    i = bisect_right(starts, ingredient) - 1
+    return i >= 0 and ingredient <= merged[i][1]
+
+
+def find_fresh_ingredients(fresh_list, ingredients_list):
+    merged = merge_ranges(fresh_list)
+    starts = [start for start, _ in merged]
+    ingredients = [int(i) for i in ingredients_list]
+
+    fresh_ingredients = 0
+
+    for ingredient in ingredients:
+        if is_fresh(merged, starts, ingredient):
+            fresh_ingredients += 1
+
+    print(f"Found {fresh_ingredients} fresh ingredients.")
+    return fresh_ingredients
+
+
+def ranges_to_bounds(merged) -> np.ndarray:
+    """Merged ranges as an int64 (n, 2) array of [start, end] rows."""
+    return np.array(merged, dtype=np.int64).reshape(-1, 2)
+
+
+def classify_with_bounds(bounds, ingredient_ids):
+    """Boolean array: which of `ingredient_ids` fall in a range of `bounds` (one `searchsorted`)."""
+    ids = np.asarray(ingredient_ids, dtype=np.int64)
+    if not len(bounds):
+        return np.zeros(ids.shape, dtype=bool)
+
+    idx = np.searchsorted(bounds[:, 0], ids, side="right") - 1
+    return (idx >= 0) & (ids <= bounds[np.maximum(idx, 0), 1])
+
+
+def classify_fresh_batch(merged, ingredient_ids):
+    return classify_with_bounds(ranges_to_bounds(merged), ingredient_ids)
+
+
+def ids_considered_fresh(fresh_list):
+    """Part 2: count how many distinct IDs are covered by the fresh ranges."""
+    merged = merge_ranges(fresh_list)
+
+    # sum lengths of merged ranges (inclusive)
     total_fresh_ids = sum(end - start + 1 for start, end in merged)
 
     print(f"Part 2: {total_fresh_ids} ingredient IDs are considered fresh.")
     return total_fresh_ids
 
+_worker_bounds = None
+
+
+def _set_worker_bounds(bounds):
+    global _worker_bounds
+    _worker_bounds = bounds
+    _worker_bounds.flags.writeable = False
+
+
+def _count_fresh_in_chunk(data_path, start, end):
+    with open(data_path, "rb") as f:
+        f.seek(start)
+        ids = np.array(f.read(end - start).split(), dtype=np.int64)
+    return int(np.count_nonzero(classify_with_bounds(_worker_bounds, ids)))
+
+
+def iter_line_chunks(data_path, chunk_bytes):
+    """Yield (start, end) byte offsets of ~`chunk_bytes` pieces ending on line breaks."""
+    size = os.path.getsize(data_path)
+    with open(data_path, "rb") as f:
+        start = 0
+        while start < size:
+            f.seek(min(start + chunk_bytes, size))
+            f.readline()
+            end = min(f.tell(), size)
+            yield start, end
+            start = end
+
+
+def count_fresh_streaming(fresh_path=None, ingredients_path=None, chunk_bytes=1 << 24, workers=None):
+    """
+    Part 1 for ingredient files of any size: the merged range index is built
+    once and handed to each worker, which reads and classifies its own
+    fixed-size chunk of the ingredient file.
+    """
+    if fresh_path is None:
+        fresh_path = Path(__file__).parent / "day5_fresh.txt"
+    if ingredients_path is None:
+        ingredients_path = Path(__file__).parent / "day5_ingredients.txt"
+
+    with open(fresh_path, encoding="utf-8") as f:
+        bounds = ranges_to_bounds(merge_ranges(line.strip() for line in f if line.strip()))
+
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_set_worker_bounds, initargs=(bounds,)
+    ) as pool:
+        # keep a bounded number of chunks in flight so memory does not grow with the feed
+        max_pending = 2 * (workers or os.cpu_count() or 1)
+        pending = deque()
+        fresh_ingredients = 0
+        for start, end in iter_line_chunks(ingredients_path, chunk_bytes):
+            if len(pending) >= max_pending:
+                fresh_ingredients += pending.popleft().result()
+            pending.append(pool.submit(_count_fresh_in_chunk, ingredients_path, start, end))
+
+        return fresh_ingredients + sum(job.result() for job in pending)
+
+
+def ids_considered_fresh_numpy(fresh_list):
+    """
+    Vectorized part 2 for millions of ranges: sort by start with `argsort`, find
+    merge boundaries from the running maximum of the ends, and sum the merged
+    lengths. Falls back to `merge_ranges` when values do not fit safely in int64.
+    """
+    if not fresh_list:
+        return 0
+    try:
+        bounds = np.array(" ".join(fresh_list).replace("-", " ").split(), dtype=np.int64)
+    except OverflowError:
+        bounds = None
+    if bounds is None or bounds.min() < -(2**62) or bounds.max() >= 2**62:
+        return sum(end - start + 1 for start, end in merge_ranges(fresh_list))
+
+    bounds = bounds.reshape(-1, 2)
+    order = np.argsort(bounds[:, 0], kind="stable")
+    starts = bounds[order, 0]
+    reach = np.maximum.accumulate(bounds[order, 1])
+
+    # a range opens a new merged block unless it overlaps/touches everything before it
+    opens = np.ones(len(starts), dtype=bool)
+    opens[1:] = starts[1:] > reach[:-1] + 1
+    block_starts = starts[opens]
+    block_ends = reach[np.append(np.flatnonzero(opens)[1:] - 1, len(starts) - 1)]
+
+    return int((block_ends - block_starts + 1).sum())
+
+
+class FreshIntervalSet:
+    """
+    Mutable set of fresh ranges with an always up-to-date count of covered IDs.
+
+    Backed by a sparse segment tree over [lo, hi): each node stores how many
+    ranges cover it entirely and how many IDs below it are covered, so adding or
+    retiring a range updates O(log(hi - lo)) nodes and never re-merges the list.
+    Overlapping ranges are counted separately, so retiring one keeps the IDs
+    still covered by the others.
+    """
+
+    def __init__(self, lo: int = 0, hi: int = 1 << 63):
+        self.lo = lo
+        self.hi = hi
+        self.ranges = Counter()
+        # node 0 is an empty placeholder child, node 1 is the root
+        self.left = [0, 0]
+        self.right = [0, 0]
+        self.count = [0, 0]
+        self.covered = [0, 0]
+
+    @classmethod
+    def from_fresh_list(cls, fresh_list, **kwargs):
+        interval_set = cls(**kwargs)
+        for f in fresh_list:
+            interval_set.add(*map(int, f.split("-")))
+        return interval_set
+
+    @property
+    def total(self) -> int:
+        return self.covered[1]
+
+    def add(self, start: int, end: int) -> None:
+        """Add the inclusive range [start, end]."""
+        if not self.lo <= start <= end < self.hi:
+            raise ValueError(f"Range {start}-{end} is outside [{self.lo}, {self.hi}).")
+        self.ranges[start, end] += 1
+        self._update(1, self.lo, self.hi, start, end + 1, 1)
+
+    def remove(self, start: int, end: int) -> None:
+        """Retire a range previously added with `add`."""
+        if not self.ranges[start, end]:
+            raise KeyError(f"Range {start}-{end} is not in the set.")
+        self.ranges[start, end] -= 1
+        if not self.ranges[start, end]:
+            del self.ranges[start, end]
+        self._update(1, self.lo, self.hi, start, end + 1, -1)
+
+    def __contains__(self, ingredient: int) -> bool:
+        node, lo, hi = 1, self.lo, self.hi
+        while node and lo <= ingredient < hi:
+            if self.count[node]:
+                return True
+            mid = (lo + hi) // 2
+            if ingredient < mid:
+                node, hi = self.left[node], mid
+            else:
+                node, lo = self.right[node], mid
+        return False
+
+    def _new_node(self) -> int:
+        self.left.append(0)
+        self.right.append(0)
+        self.count.append(0)
+        self.covered.append(0)
+        return len(self.count) - 1
+
+    def _update(self, node, lo, hi, start, stop, delta):
+        # [start, stop) is the half-open range being added (+1) or retired (-1)
+        if start <= lo and hi <= stop:
+            self.count[node] += delta
+        else:
+            mid = (lo + hi) // 2
+            if start < mid:
+                if not self.left[node]:
+                    self.left[node] = self._new_node()
+                self._update(self.left[node], lo, mid, start, stop, delta)
+            if stop > mid:
+                if not self.right[node]:
+                    self.right[node] = self._new_node()
+                self._update(self.right[node], mid, hi, start, stop, delta)
+
+        if self.count[node]:
+            self.covered[node] = hi - lo
+        else:
+            self.covered[node] = self.covered[self.left[node]] + self.covered[self.right[node]]
+
 
 if __name__ == "__main__":
     fresh_list, ingredients_list = read_and_clean_data()
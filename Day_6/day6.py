@@ -1,5 +1,61 @@
+import math
+import mmap
+import operator
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-import pandas as pd
+
+import numpy as np
+
+
+def parse_worksheet(data: bytes) -> tuple[np.ndarray | list[list[int]], list[bytes]]:
+    """
+    Split a whitespace-separated worksheet into its number rows (2D int64 array,
+    or nested Python ints if a value does not fit) and the operator row.
+    """
+    lines = [line for line in data.splitlines() if line.strip()]
+    operators = lines[-1].split()
+    tokens = b" ".join(lines[:-1]).split()
+    width = len(operators)
+    if len(tokens) != width * (len(lines) - 1):
+        raise ValueError("Worksheet rows have inconsistent number of columns.")
+
+    try:
+        numbers = np.array(tokens, dtype=np.int64).reshape(-1, width)
+    except OverflowError:
+        values = [int(t) for t in tokens]
+        numbers = [values[i : i + width] for i in range(0, len(values), width)]
+    return numbers, operators
+
+
+def evaluate_columns(numbers, operators) -> int:
+    """Sum of every column reduced with its operator, vectorized where int64 is safe."""
+    for col, op in enumerate(operators):
+        if op not in (b"+", b"*"):
+            raise ValueError(f"Unexpected operator {op.decode()!r} in column {col}")
+
+    if not isinstance(numbers, np.ndarray):
+        columns = list(zip(*numbers))
+        return sum(
+            sum(col) if op == b"+" else math.prod(col) for col, op in zip(columns, operators)
+        )
+
+    ops = np.array(operators)
+
+    # estimate result magnitudes in float to find columns that might overflow int64
+    magnitude = np.abs(numbers.astype(np.float64))
+    is_sum = ops == b"+"
+    safe = np.where(
+        is_sum,
+        magnitude.sum(axis=0) < 2.0**62,
+        np.log2(np.maximum(magnitude, 1)).sum(axis=0) < 62,
+    )
+
+    results = np.where(is_sum, numbers.sum(axis=0), np.prod(numbers, axis=0))
+    total = int(results[safe].sum(dtype=object))
+    for col in np.flatnonzero(~safe):
+        values = numbers[:, col].tolist()
+        total += sum(values) if is_sum[col] else math.prod(values)
+    return total
 
 
 def read_and_clean_data_part_1():
@@ -9,130 +65,217 @@ def read_and_clean_data_part_1():
             f"Data file not found: {data_path!s}.\n"
             "Make sure you're running the script from the project root or that the file exists in the `Day_6` folder."
         )
-    df = pd.read_csv(
-        data_path,
-        sep="\s+",  
-        header=None,
-        engine="python",
-    )
+    numbers, operators = parse_worksheet(data_path.read_bytes())
+    return evaluate_columns(numbers, operators)
 
-    df.columns = range(len(df.columns))
-    df.iloc[:-1] = df.iloc[:-1].apply(pd.to_numeric)
-
-    results = []
-    for col in df.columns:
-        op = df.iloc[-1, col]
-        if op == "+":
-            results.append(df.iloc[:-1, col].sum())
-        elif op == "*":
-            results.append(df.iloc[:-1, col].prod())
-        else:
-            raise ValueError(f"Unexpected operator {op!r} in column {col}")
-    final_result = sum(results)
-    return final_result
-
-def read_grid_as_dataframe():
-    """Reads the file as a full character grid (needed for part 2)."""
+def read_grid() -> np.ndarray:
+    """Reads the file once as a (rows, width) uint8 character grid, padded with spaces."""
     data_path = Path(__file__).parent / "day6_data.txt"
     if not data_path.exists():
         raise FileNotFoundError(f"Data file not found: {data_path!s}")
 
-    with data_path.open() as f:
-        lines = [line.rstrip("\n") for line in f]
+    lines = data_path.read_bytes().split(b"\n")
+    while lines and not lines[-1].strip():
+        lines.pop()
 
     # Normalize all lines to same width
     width = max(len(line) for line in lines)
-    lines = [line.ljust(width) for line in lines]
+    return np.frombuffer(b"".join(line.ljust(width) for line in lines), dtype=np.uint8).reshape(
+        len(lines), width
+    )
 
-    # Convert to DataFrame of characters
-    df = pd.DataFrame([list(row) for row in lines])
-    return df
 
+def solve_part1(grid: np.ndarray) -> int:
+    numbers, operators = parse_worksheet(b"\n".join(row.tobytes() for row in grid))
+    return evaluate_columns(numbers, operators)
 
-def find_blocks(df: pd.DataFrame):
+
+def find_blocks(grid: np.ndarray):
     """Returns list of (start_col, end_col) for each problem block."""
-    col_is_empty = (df == " ").all(axis=0)
+    used = np.zeros(grid.shape[1] + 2, dtype=np.int8)
+    used[1:-1] = (grid != ord(" ")).any(axis=0)
+    edges = np.diff(used)
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1) - 1
+    return list(zip(starts.tolist(), ends.tolist()))
 
-    blocks = []
-    in_block = False
-    start = None
 
-    for col, empty in col_is_empty.items():
-        if not empty and not in_block:
-            in_block = True
-            start = col
-        elif empty and in_block:
-            in_block = False
-            blocks.append((start, col - 1))
+def column_numbers(grid: np.ndarray):
+    """
+    Decodes every column (top-to-bottom digits, bottom row excluded) into one
+    number at once. Returns the values and a mask of columns that hold digits.
+    """
+    body = grid[:-1]
+    is_digit = (body >= ord("0")) & (body <= ord("9"))
+    digits = np.where(is_digit, body.astype(np.int64) - ord("0"), 0)
+    has_digits = is_digit.any(axis=0)
 
-    if in_block:
-        blocks.append((start, df.shape[1] - 1))
+    if body.shape[0] > 18:
+        # too many digits for int64: decode the columns with Python ints
+        values = [int(body[:, col].tobytes().strip() or b"0") for col in range(body.shape[1])]
+        return np.array(values, dtype=object), has_digits
 
-    return blocks
+    # place value of each digit = number of digits below it in the same column
+    below = np.cumsum(is_digit[::-1], axis=0)[::-1] - is_digit
+    values = (digits * 10 ** below).sum(axis=0)
+    return values, has_digits
 
 
-def evaluate_block_part2(df: pd.DataFrame, start: int, end: int) -> int:
+def tree_reduce(values, op):
     """
-    Evaluates one block for part 2, where each column inside the block
-    represents one number (top-to-bottom digits), and the operator is
-    in the bottom row.
+    Combines `values` pairwise in a balanced tree. For big-integer products and
+    sums this keeps operands of similar size, instead of growing one huge
+    accumulator left to right.
     """
+    values = list(values)
+    if not values:
+        raise ValueError("Cannot reduce an empty sequence.")
+    while len(values) > 1:
+        paired = [op(values[i], values[i + 1]) for i in range(0, len(values) - 1, 2)]
+        if len(values) % 2:
+            paired.append(values[-1])
+        values = paired
+    return values[0]
+
+
+def block_operands(grid: np.ndarray, start: int, end: int, columns=None) -> tuple[str, list[int]]:
+    """Operator and numbers (read right to left) of one part 2 block."""
+    if columns is None:
+        columns = column_numbers(grid)
+    values, has_digits = columns
 
     # Operator for the whole block sits somewhere in the bottom row
-    op_chunk = "".join(df.iloc[-1, start:end+1])
+    op_chunk = grid[-1, start : end + 1].tobytes()
 
-    if "+" in op_chunk:
+    if b"+" in op_chunk:
         op = "+"
-    elif "*" in op_chunk:
+    elif b"*" in op_chunk:
         op = "*"
     else:
         raise ValueError(f"No operator found in block {start}-{end}")
 
-    numbers = []
-
-    # Read columns from right to left
-    for col in range(end, start - 1, -1):
-        col_chars = df.iloc[:-1, col]  # exclude bottom row
-        digits = "".join(col_chars).strip()
+    # Read columns from right to left, skipping columns that contain only spaces
+    numbers = [int(n) for n in values[start : end + 1][has_digits[start : end + 1]][::-1]]
+    return op, numbers
 
-        if digits:  # skip columns that contain only spaces
-            numbers.append(int(digits))
 
-    # Compute block result
+def evaluate_operands(op: str, numbers: list[int]) -> int:
     if op == "+":
         return sum(numbers)
-    else:
-        product = 1
-        for n in numbers:
-            product *= n
-        return product
+    return tree_reduce(numbers, operator.mul) if numbers else 1
+
+
+def evaluate_block_part2(grid: np.ndarray, start: int, end: int, columns=None) -> int:
+    """
+    Evaluates one block for part 2, where each column inside the block
+    represents one number (top-to-bottom digits), and the operator is
+    in the bottom row.
+    """
+    return evaluate_operands(*block_operands(grid, start, end, columns))
+
+
+def _evaluate_batch(batch) -> int:
+    return tree_reduce((evaluate_operands(op, numbers) for op, numbers in batch), operator.add)
 
 
 # ---------------------------------------------------------
 # PART 2 LOGIC
 # ---------------------------------------------------------
 
-def solve_part2():
-    df = read_grid_as_dataframe()
-    blocks = find_blocks(df)
+def solve_part2(grid: np.ndarray | None = None) -> int:
+    if grid is None:
+        grid = read_grid()
+    blocks = find_blocks(grid)
+    columns = column_numbers(grid)
 
     total = 0
     for start, end in blocks:
-        total += evaluate_block_part2(df, start, end)
+        total += evaluate_block_part2(grid, start, end, columns)
 
     return total
 
 
+def solve_part2_parallel(grid: np.ndarray | None = None, workers: int | None = None, batch_size: int = 256) -> int:
+    """
+    `solve_part2` with blocks evaluated in a process pool, in batches. Batch
+    totals and the final total are reduced as balanced trees.
+    """
+    if grid is None:
+        grid = read_grid()
+    columns = column_numbers(grid)
+    operands = [block_operands(grid, start, end, columns) for start, end in find_blocks(grid)]
+    if not operands:
+        return 0
+
+    batches = [operands[i : i + batch_size] for i in range(0, len(operands), batch_size)]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return tree_reduce(pool.map(_evaluate_batch, batches), operator.add)
+
+
+def _row_spans(mm) -> list[tuple[int, int]]:
+    """(offset, length) of every non-empty row of the mapped worksheet."""
+    spans = []
+    start = 0
+    while start < len(mm):
+        end = mm.find(b"\n", start)
+        if end == -1:
+            end = len(mm)
+        spans.append((start, end - start))
+        start = end + 1
+    while spans and not mm[spans[-1][0] : spans[-1][0] + spans[-1][1]].strip():
+        spans.pop()
+    return spans
+
+
+def stream_worksheet(data_path=None, strip_width: int = 1 << 20) -> tuple[int, int]:
+    """
+    Part 1 and part 2 totals for very wide worksheets, reading aligned column
+    strips of every row through mmap. A block cut by a strip edge is carried
+    over to the next strip, so memory stays bounded by the strip width (plus
+    the widest block).
+    """
+    if data_path is None:
+        data_path = Path(__file__).parent / "day6_data.txt"
+
+    part1 = 0
+    part2 = 0
+    with open(data_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        spans = _row_spans(mm)
+        width = max(length for _, length in spans)
+        carry = np.zeros((len(spans), 0), dtype=np.uint8)
+
+        for left in range(0, width, strip_width):
+            strip = np.full((len(spans), min(strip_width, width - left)), ord(" "), dtype=np.uint8)
+            for r, (offset, length) in enumerate(spans):
+                if left < length:
+                    row = mm[offset + left : offset + min(left + strip_width, length)]
+                    strip[r, : len(row)] = np.frombuffer(row, dtype=np.uint8)
+
+            chunk = np.hstack([carry, strip])
+            blocks = find_blocks(chunk)
+            carry = chunk[:, :0]
+            if blocks and blocks[-1][1] == chunk.shape[1] - 1 and left + strip_width < width:
+                carry = chunk[:, blocks.pop()[0] :].copy()
+
+            columns = column_numbers(chunk)
+            for start, end in blocks:
+                op, numbers = block_operands(chunk, start, end, columns)
+                rows = [int(row) for row in map(bytes, chunk[:-1, start : end + 1]) if row.strip()]
+                part1 += evaluate_operands(op, rows)
+                part2 += evaluate_operands(op, numbers)
+
+    return part1, part2
+
+
 # ---------------------------------------------------------
 # MAIN
 # ---------------------------------------------------------
 
 if __name__ == "__main__":
-    p1 = read_and_clean_data_part_1()
+    grid = read_grid()
+
+    p1 = solve_part1(grid)
     print(f"Part 1 result: {p1}")
 
-    p2 = solve_part2()
+    p2 = solve_part2(grid)
     print(f"Part 2 result: {p2}")
-
-
-    
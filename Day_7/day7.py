@@ -1,5 +1,6 @@
 from pathlib import Path
-from functools import lru_cache
+
+import numpy as np
 
 
 def read_grid(filename: str = "day7_data.txt") -> list[str]:
@@ -78,30 +79,145 @@ def count_splits(grid: list[str]) -> int:
 
     return split_count
 
-def count_timelines(grid: list[str]) -> int:
-    height = len(grid)
+
+# maps '^' to '1' and every other byte to '0', for building row bitsets
+_SPLITTER_BITS = bytes(ord("1") if b == ord("^") else ord("0") for b in range(256))
+
+
+def row_bitset(line: str) -> int:
+    """Splitters of one row as an int, bit c set when column c holds '^'."""
+    return int(line.encode("ascii").translate(_SPLITTER_BITS)[::-1], 2) if line else 0
+
+
+def count_splits_bitset(grid: list[str]) -> int:
+    """
+    Same result as `count_splits`, with each row's beams and splitters held as
+    big-integer bitsets, so a whole row is propagated with a few shifts and masks.
+    """
     width = len(grid[0])
+    full = (1 << width) - 1
     start_row, start_col = find_start(grid)
 
-    @lru_cache(maxsize=None)
-    def dp(r: int, c: int) -> int:
-        # Outside manifold: one completed timeline
-        if r < 0 or r >= height or c < 0 or c >= width:
-            return 1
+    beams = 1 << start_col
+    split_count = 0
+
+    for line in grid[start_row:]:
+        if not beams:
+            break
+        splitters = row_bitset(line)
+        hits = beams & splitters
+        split_count += hits.bit_count()
+        beams = (beams & ~splitters) | (((hits << 1) | (hits >> 1)) & full)
+
+    return split_count
 
-        cell = grid[r][c]
 
-        if cell in (".", "S"):
-            # Just go straight down
-            return dp(r + 1, c)
-        elif cell == "^":
+def _sweep_numpy(grid: list[str], start_row: int, below: list[int], modulus: int | None):
+    """
+    Bottom-up sweep over int64 count vectors. Stops early if the next row would
+    overflow int64 and returns the counts so far plus the row still to process
+    (start_row - 1 when the sweep completed).
+    """
+    limit = np.iinfo(np.int64).max
+    # one padding column on each side: leaving the manifold sideways is one timeline
+    counts = np.ones(len(below) + 2, dtype=np.int64)
+    counts[1:-1] = below
+
+    for r in range(len(grid) - 1, start_row - 1, -1):
+        splitters = np.frombuffer(grid[r].encode("ascii"), dtype=np.uint8) == ord("^")
+        if not splitters.any():
+            continue
+        left = counts[:-2][splitters]
+        right = counts[2:][splitters]
+        if (left > limit - right).any():
+            return counts[1:-1].tolist(), r
+
+        merged = left + right
+        if modulus is not None:
+            merged %= modulus
+        counts[1:-1][splitters] = merged
+
+    return counts[1:-1].tolist(), start_row - 1
+
+
+def _timelines_row(line: str, below: list[int], modulus: int | None = None) -> list[int]:
+    """Counts for beams entering `line`, given the counts for the row below it."""
+    if "^" not in line:
+        # Just go straight down
+        return below
+
+    width = len(below)
+    current = below[:]
+    for c, cell in enumerate(line):
+        if cell == "^":
             # Split into two timelines: down-left and down-right
-            return dp(r + 1, c - 1) + dp(r + 1, c + 1)
-        else:
-            # Treat unknown chars as empty
-            return dp(r + 1, c)
+            left = below[c - 1] if c > 0 else 1
+            right = below[c + 1] if c + 1 < width else 1
+            current[c] = left + right if modulus is None else (left + right) % modulus
+    return current
+
+
+def count_timelines(grid: list[str], use_numpy: bool = False, modulus: int | None = None) -> int:
+    """
+    Number of timelines from S, counted bottom-up one row at a time with a
+    single per-column vector (O(width) memory, no recursion).
+
+    `use_numpy` runs the sweep on int64 vectors and switches to Python ints if a
+    count would overflow (or if `modulus` is 2**62 or more). With `modulus`,
+    counts are reduced modulo it.
+    """
+    height = len(grid)
+    width = len(grid[0])
+    start_row, start_col = find_start(grid)
+
+    # below[c]: timelines for a beam entering row r + 1 at column c
+    # (below the grid, every beam is one completed timeline)
+    below = [1] * width
+    row = height - 1
+    # a modulus that does not fit in int64 cannot be used by the NumPy sweep
+    if use_numpy and (modulus is None or modulus < 2**62):
+        below, row = _sweep_numpy(grid, start_row, below, modulus)
+
+    for r in range(row, start_row - 1, -1):
+        below = _timelines_row(grid[r], below, modulus)
+
+    return below[start_col]
+
+
+def timeline_table(grid: list[str], modulus: int | None = None) -> list[list[int]]:
+    """
+    Timeline counts for every possible start, from one bottom-up pass:
+    table[r][c] is the number of timelines for a beam entering row r at
+    column c (S is treated as empty). Rows without splitters share the row
+    below them.
+    """
+    height = len(grid)
+    table = [None] * height + [[1] * len(grid[0])]
+    for r in range(height - 1, -1, -1):
+        table[r] = _timelines_row(grid[r], table[r + 1], modulus)
+    return table
+
+
+def timelines_from(table: list[list[int]], row: int, col: int) -> int:
+    """O(1) lookup in a `timeline_table`; starting outside the manifold is one timeline."""
+    if 0 <= row < len(table) - 1 and 0 <= col < len(table[row]):
+        return table[row][col]
+    return 1
+
+
+def save_timeline_table(table: list[list[int]], path) -> None:
+    """Save as int64 .npy when every count fits, otherwise as decimal strings."""
+    try:
+        np.save(path, np.array(table, dtype=np.int64))
+    except OverflowError:
+        np.save(path, np.array([[str(n) for n in row] for row in table]))
+
 
-    return dp(start_row, start_col)
+def load_timeline_table(path) -> list[list[int]]:
+    data = np.load(path)
+    if data.dtype.kind == "U":
+        return [[int(n) for n in row] for row in data.tolist()]
+    return data.tolist()
 
 
 def main():